@@ -0,0 +1,42 @@
+-- Orders database: hot path index catalog
+--
+-- Brings an existing orders database up to date with schemas/orders.sql for
+-- the queries issued by the order service. Safe to re-run. Run outside a
+-- transaction block (CREATE INDEX CONCURRENTLY does not build inside one):
+--
+--   psql "$ORDER_DB_URL" -f database/migrations/001_orders_hot_path_indexes.sql
+--
+-- Query                                         Index
+-- cart WHERE id = $1                            cart_pkey
+-- cart_items WHERE cart_id = $1                 idx_cart_items_cart_id
+-- orders WHERE id = $1                          orders_pkey
+-- order_items WHERE order_id = $1               idx_order_items_order_id
+-- orders WHERE user_id = $1
+--     ORDER BY created_at DESC, id DESC         idx_orders_user_created_id
+-- order_outbox ORDER BY id                      order_outbox_pkey
+-- cart WHERE expires_at < ... (expiry sweeps)   idx_cart_expires_at
+
+-- Order event outbox (relayed to SQS by the order service)
+CREATE TABLE IF NOT EXISTS order_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Outbox events SQS rejected as sender faults (not retried)
+CREATE TABLE IF NOT EXISTS order_outbox_dead_letter (
+    id BIGINT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    failed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cart_items_cart_id ON cart_items(cart_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_order_items_order_id ON order_items(order_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cart_expires_at ON cart(expires_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_user_created_id ON orders(user_id, created_at DESC, id DESC)
+    INCLUDE (status, total, currency);
+
+-- Superseded by idx_orders_user_created_id, which has user_id as its prefix
+DROP INDEX CONCURRENTLY IF EXISTS idx_orders_user_id;
@@ -52,9 +52,11 @@ CREATE TABLE IF NOT EXISTS orders (
 );
 
 CREATE INDEX idx_orders_order_number ON orders(order_number);
-CREATE INDEX idx_orders_user_id ON orders(user_id);
 CREATE INDEX idx_orders_status ON orders(status);
 CREATE INDEX idx_orders_created_at ON orders(created_at);
+-- Covers keyset pagination of a user's orders (index-only scan)
+CREATE INDEX idx_orders_user_created_id ON orders(user_id, created_at DESC, id DESC)
+    INCLUDE (status, total, currency);
 
 -- Order items table
 CREATE TABLE IF NOT EXISTS order_items (
@@ -76,6 +78,22 @@ CREATE TABLE IF NOT EXISTS order_items (
 CREATE INDEX idx_order_items_order_id ON order_items(order_id);
 CREATE INDEX idx_order_items_product_id ON order_items(product_id);
 
+-- Order event outbox (relayed to SQS by the order service)
+CREATE TABLE IF NOT EXISTS order_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Outbox events SQS rejected as sender faults (not retried)
+CREATE TABLE IF NOT EXISTS order_outbox_dead_letter (
+    id BIGINT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    failed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Order status history table
 CREATE TABLE IF NOT EXISTS order_status_history (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -0,0 +1,42 @@
+# Gunicorn configuration for the order service
+#
+#   gunicorn -c gunicorn.conf.py main:app
+#
+# Workers run the FastAPI app under UvicornWorker (uvloop + httptools when
+# installed). Metrics from every worker are written to PROMETHEUS_MULTIPROC_DIR
+# and served, aggregated, by the master on METRICS_PORT so scrapes never
+# compete with request handling.
+import glob
+import multiprocessing
+import os
+
+# Must be set before prometheus_client is imported: it picks its value class
+# (in-memory or multiprocess files) at import time, and workers inherit the
+# master's already-imported module
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus')
+
+from prometheus_client import CollectorRegistry, multiprocess, start_http_server
+
+bind = "0.0.0.0:8082"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv('WORKERS', 2 * multiprocessing.cpu_count()))
+worker_tmp_dir = "/dev/shm"
+loglevel = "warning"
+
+
+def on_starting(server):
+    # Start from a clean directory so values from a previous run don't leak in
+    multiproc_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    os.makedirs(multiproc_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(multiproc_dir, '*.db')):
+        os.remove(path)
+
+
+def when_ready(server):
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(int(os.getenv('METRICS_PORT', '8083')), registry=registry)
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)